@@ -37,6 +37,9 @@ class DataField:
     # Valid MongoDB data types used in this application
     # all other types are treated as text with regex search
     VALID_TYPES = ['string', 'number', 'date', 'boolean', 'array', 'object', 'objectid', 'null']
+
+    # Fixed attribute set; avoids a per-instance __dict__
+    __slots__ = ('name', 'data_type', 'alias')
     
     def __init__(self, name: str, data_type: str, alias: str = None):
         """Initialize a DataField.
@@ -26,17 +26,142 @@ Example usage with Flask:
         return jsonify(result)
     ```
 """
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from bson.objectid import ObjectId
 import json
+import re
+from pymongo import UpdateOne
 from pymongo.database import Database
 from pymongo.collection import Collection
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Import DataField from datatables module
 from mongo_datatables.datatables import DataField
 
 
+# Characters a JSON document may start with (including leading whitespace);
+# strings starting with anything else are never valid JSON
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI \t\r\n')
+
+# Numeric string forms accepted for 'number' fields (digit groups may be separated
+# by single underscores, as int() and float() allow); checking these up front
+# avoids raising and catching ValueError for free-text values
+_DIGITS = r'\d(?:_?\d)*'
+_INTEGER_PATTERN = re.compile(rf'[+-]?{_DIGITS}')
+_DECIMAL_PATTERN = re.compile(rf'[+-]?(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?')
+
+# String values treated as True for 'boolean' fields; anything else is False
+_TRUE_STRINGS = frozenset(('true', 'yes', '1', 't', 'y'))
+
+# Explicit formats tried for declared 'date' fields that are not valid ISO 8601
+# (e.g. fractional seconds with other than 3 or 6 digits before Python 3.11)
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y/%m/%d",
+    "%Y/%m/%d %H:%M:%S",
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify_key(key: str) -> Tuple[bool, bool]:
+    """Classify a submitted field name for document preprocessing.
+
+    The column set is stable across rows and requests, so results are memoized.
+
+    Args:
+        key: Field name, possibly in dot notation
+
+    Returns:
+        Tuple of (is_dotted, is_date_field); a field is treated as a date when
+        its name (and so its final dotted segment) ends in 'date', 'time' or 'at'
+    """
+    return '.' in key, key.lower().endswith(('date', 'time', 'at'))
+
+
+def _looks_like_date(value: str) -> bool:
+    """Cheaply check whether a string starts with a YYYY-MM-DD date.
+
+    Used to skip the date parser (and the exception it raises) for the
+    free-text values of fields whose names merely end in 'date', 'time' or 'at'.
+
+    Args:
+        value: String to check
+
+    Returns:
+        True if the value could be an ISO 8601 date or datetime
+    """
+    return len(value) >= 10 and value[4] == '-' and value[7] == '-' and value[:4].isdigit()
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date or datetime string.
+
+    A trailing 'Z' (UTC designator) is translated to '+00:00' so it is accepted
+    by datetime.fromisoformat on every supported Python version. Date-only
+    strings resolve to midnight.
+
+    Results are memoized since Editor payloads often repeat the same timestamp
+    across rows. Only successful parses are cached; invalid values raise again.
+
+    Args:
+        value: ISO 8601 formatted string
+
+    Returns:
+        Parsed datetime object
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 string
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _as_stored(value: Any) -> Any:
+    """Return a value as MongoDB stores and reads it back.
+
+    BSON datetimes are naive UTC with millisecond precision, so timezone-aware
+    datetimes are converted to UTC and sub-millisecond digits are dropped.
+    Nested documents and arrays are handled recursively.
+
+    Args:
+        value: Value about to be inserted
+
+    Returns:
+        The value as a subsequent read from the database would return it
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    if isinstance(value, dict):
+        return {key: _as_stored(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_as_stored(val) for val in value]
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _to_object_id(doc_id: str) -> ObjectId:
+    """Convert a document ID string to an ObjectId.
+
+    Conversions are memoized so each distinct ID is validated only once.
+
+    Args:
+        doc_id: 24-character hex string
+
+    Returns:
+        The corresponding ObjectId
+
+    Raises:
+        bson.errors.InvalidId: If doc_id is not a valid ObjectId
+    """
+    return ObjectId(doc_id)
+
+
 class Editor:
     """Server-side processor for DataTables Editor with MongoDB.
 
@@ -73,6 +198,23 @@ class Editor:
         self.field_types = {field.name: field.data_type for field in self.data_fields} if self.data_fields else {}
         self.ui_to_db_field_map = {field.alias: field.name for field in self.data_fields} if self.data_fields else {}
 
+        # Last strptime format that matched a 'date' field value
+        self._preferred_date_format: Optional[str] = None
+
+        # Resolve the type conversion for each declared field once, so updates
+        # dispatch straight to it instead of re-testing the field type per value.
+        # Only plain functions are stored; date fields need per-instance state and
+        # are dispatched to self._coerce_date at the call site to avoid a reference cycle
+        coercers = {
+            'number': Editor._coerce_number,
+            'boolean': Editor._coerce_boolean,
+            'array': Editor._coerce_array,
+        }
+        self._field_coercers = {
+            name: coercers[data_type] for name, data_type in self.field_types.items() if data_type in coercers
+        }
+        self._date_fields = frozenset(name for name, data_type in self.field_types.items() if data_type == 'date')
+
     @property
     def db(self) -> Database:
         """Get the MongoDB database instance.
@@ -172,50 +314,66 @@ class Editor:
 
         try:
             for doc_id in self.list_of_ids:
-                self.collection.delete_one({"_id": ObjectId(doc_id)})
+                self.collection.delete_one({"_id": _to_object_id(doc_id)})
             return {}
         except Exception as e:
             return {"error": str(e)}
 
     def create(self) -> Dict[str, Any]:
-        """Create a new document in the collection."""
+        """Create one or more new documents in the collection.
+
+        Every row submitted by Editor is inserted with a single insert_many call
+        and echoed back in the response without re-reading it from the database.
+        """
         if not self.data or '0' not in self.data:
             raise ValueError("Data is required for create operation")
 
         try:
-            # Process the document using our updated method
-            main_data, dot_notation_data = self._preprocess_document(self.data['0'])
+            documents = [self._build_document(row) for row in self.data.values()]
 
-            # Build the combined document for creation
-            data_obj = main_data.copy()
+            # Insert all documents in one round-trip
+            result = self.collection.insert_many(documents)
 
-            # Handle nested fields by parsing dot notation
-            for dot_key, value in dot_notation_data.items():
-                parts = dot_key.split('.')
-                current = data_obj
+            # Echo the inserted documents back without another round-trip, normalized
+            # to what the database stores so the row matches the next table load
+            response_data = [
+                self._format_response_document(_as_stored(dict(document, _id=inserted_id)))
+                for document, inserted_id in zip(documents, result.inserted_ids)
+            ]
 
-                # Build nested structure
-                for i, part in enumerate(parts[:-1]):
-                    if part not in current:
-                        current[part] = {}
-                    current = current[part]
+            return {"data": response_data}
+        except Exception as e:
+            print(f"Error in create operation: {e}")
+            return {"error": str(e)}
 
-                # Set the final value
-                current[parts[-1]] = value
+    def _build_document(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a nested document for insertion from a submitted Editor row.
 
-            # Insert the document
-            result = self.collection.insert_one(data_obj)
+        Args:
+            row: Row data from Editor
 
-            # Get the inserted document for the response
-            created_doc = self.collection.find_one({"_id": result.inserted_id})
+        Returns:
+            Document with dot notation fields expanded into nested objects
+        """
+        # Process the document using our updated method; the returned document
+        # is a fresh dict, so it is extended in place
+        data_obj, dot_notation_data = self._preprocess_document(row)
 
-            # Format the response
-            response_data = self._format_response_document(created_doc)
+        # Handle nested fields by parsing dot notation
+        for dot_key, value in dot_notation_data.items():
+            parts = dot_key.split('.')
+            current = data_obj
 
-            return {"data": [response_data]}
-        except Exception as e:
-            print(f"Error in create operation: {e}")
-            return {"error": str(e)}
+            # Build nested structure
+            for part in parts[:-1]:
+                if part not in current:
+                    current[part] = {}
+                current = current[part]
+
+            # Set the final value
+            current[parts[-1]] = value
+
+        return data_obj
 
     def _preprocess_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
         """Process document data before database operations.
@@ -237,13 +395,21 @@ class Editor:
         # Store dot notation fields for MongoDB update operations
         dot_notation_updates = {}
 
+        # Bind lookups used for every field to locals
+        json_loads = json.loads
+        json_start_chars = _JSON_START_CHARS
+        classify_key = _classify_key
+
         # Process each field
         for key, val in processed_doc.items():
+            is_dotted, is_date_field = classify_key(key)
+            is_str = isinstance(val, str)
+
             # Try to parse JSON strings into objects/arrays
-            if isinstance(val, str):
+            if is_str and val[:1] in json_start_chars:
                 try:
-                    parsed_val = json.loads(val)
-                    if '.' in key:
+                    parsed_val = json_loads(val)
+                    if is_dotted:
                         # Store with dot notation for MongoDB update
                         dot_notation_updates[key] = parsed_val
                     else:
@@ -253,87 +419,129 @@ class Editor:
                     # Not valid JSON, continue with other processing
                     pass
 
-            # Handle date strings - check both the key itself and the final segment after a dot
-            is_date_field = (
-                    key.lower().endswith(('date', 'time', 'at')) or
-                    (key.split('.')[-1].lower().endswith(('date', 'time', 'at')))
-            )
-
-            if isinstance(val, str) and is_date_field and val.strip():
+            # Handle date strings
+            if is_str and is_date_field and _looks_like_date(val):
                 try:
                     # Convert to datetime object for MongoDB
-                    date_obj = datetime.fromisoformat(val.replace('Z', '+00:00'))
+                    date_obj = _parse_iso_datetime(val)
 
-                    if '.' in key:
+                    if is_dotted:
                         # Store with dot notation for MongoDB update
                         dot_notation_updates[key] = date_obj
                     else:
                         processed_doc[key] = date_obj
                 except (ValueError, TypeError):
                     # If date parsing fails, keep as string but still handle dot notation
-                    if '.' in key:
+                    if is_dotted:
                         dot_notation_updates[key] = val
-            elif '.' in key:
+            elif is_dotted:
                 # Non-date field with dot notation
                 dot_notation_updates[key] = val
 
-        # Remove all dot notation fields from the main doc since we'll handle them separately
-        for key in list(processed_doc.keys()):
-            if '.' in key:
-                del processed_doc[key]
+        # Remove all dot notation fields from the main doc since we'll handle them separately;
+        # every dotted key was recorded above, so documents without any need no further pass
+        for key in dot_notation_updates:
+            del processed_doc[key]
 
         # Return both the processed document and dot notation fields
         return processed_doc, dot_notation_updates
 
     def edit(self) -> Dict[str, Any]:
-        """Edit one or more documents in the collection."""
+        """Edit one or more documents in the collection.
+
+        All updates are sent in a single unordered bulk_write and the edited
+        documents are read back with a single find.
+        """
         if not self.list_of_ids:
             raise ValueError("Document ID is required for edit operation")
 
         try:
-            data = []
+            rows = {doc_id: self.data[doc_id] for doc_id in self.list_of_ids if doc_id in self.data}
+            object_ids = [_to_object_id(doc_id) for doc_id in rows]
 
-            for doc_id in self.list_of_ids:
-                if doc_id not in self.data:
-                    continue
+            # Process all rows together, converting each typed column in one pass
+            updates_by_row = self._process_batch(rows)
 
-                # Get the update data for this document
-                update_data = self.data[doc_id]
+            # If a row has updates, apply them all at once
+            operations = [
+                UpdateOne({"_id": object_id}, {"$set": updates})
+                for object_id, updates in zip(object_ids, updates_by_row.values()) if updates
+            ]
 
-                # Process document with recursive function
-                updates = {}
-                self._process_updates(update_data, updates, "")
+            if operations:
+                self.collection.bulk_write(operations, ordered=False)
 
-                # If we have updates, apply them all at once
-                if updates:
-                    self.collection.update_one(
-                        {"_id": ObjectId(doc_id)},
-                        {"$set": updates}
-                    )
+            if not object_ids:
+                return {"data": []}
 
-                # Get the updated document
-                updated_doc = self.collection.find_one({"_id": ObjectId(doc_id)})
+            # Get the updated documents, preserving the requested order
+            updated_docs = {doc["_id"]: doc for doc in self.collection.find({"_id": {"$in": object_ids}})}
 
-                # Format response
-                response_data = self._format_response_document(updated_doc)
-                data.append(response_data)
+            # Format response
+            data = [
+                self._format_response_document(updated_docs[object_id])
+                for object_id in object_ids if object_id in updated_docs
+            ]
 
             return {"data": data}
         except Exception as e:
             print(f"Edit error: {e}")
             return {"error": str(e)}
 
-    def _process_updates(self, data, updates, prefix=""):
-        """Recursively process updates at any nesting level.
+    def _process_batch(self, rows: Dict[Any, Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """Process updates for several rows, converting values column by column.
+
+        Each typed column is converted with a single pass of its coercer over the
+        values from all rows, rather than re-dispatching on the field type per cell.
+
+        Args:
+            rows: Row data from Editor keyed by document ID
+
+        Returns:
+            Dot notation updates for each row, keyed by document ID
+        """
+        field_coercers = self._field_coercers
+        date_fields = self._date_fields
+        updates_by_row = {}
+        columns = {}
+
+        for row_id, row in rows.items():
+            updates = {}
+            self._flatten_updates(row, updates)
+            updates_by_row[row_id] = updates
+
+            # Collect the string values of typed columns along with the row they belong to
+            for full_key, value in updates.items():
+                if isinstance(value, str) and (full_key in field_coercers or full_key in date_fields):
+                    column_rows, column_values = columns.setdefault(full_key, ([], []))
+                    column_rows.append(updates)
+                    column_values.append(value)
+
+        for full_key, (column_rows, column_values) in columns.items():
+            if full_key in date_fields:
+                coerce_date = self._coerce_date
+                converted = [coerce_date(full_key, value) for value in column_values]
+            else:
+                converted = map(field_coercers[full_key], column_values)
+
+            for updates, value in zip(column_rows, converted):
+                updates[full_key] = value
+
+        return updates_by_row
+
+    def _flatten_updates(self, data, updates, prefix=""):
+        """Recursively flatten nested update data into dot notation keys.
 
         Args:
-            data: Data to process (dict or value)
+            data: Data to flatten (dict or value)
             updates: Updates dict to populate (will be modified in-place)
             prefix: Dot notation prefix for the current nesting level
         """
         if not isinstance(data, dict):
             return
 
+        flatten_updates = self._flatten_updates
+
         for key, value in data.items():
             if value is None:
                 continue
@@ -343,45 +551,75 @@ class Editor:
 
             if isinstance(value, dict):
                 # Recurse into nested dictionaries
-                self._process_updates(value, updates, full_key)
+                flatten_updates(value, updates, full_key)
             else:
-                # Process leaf value
-                field_type = self.field_types.get(full_key, 'string')
-
-                if field_type == 'date' and isinstance(value, str):
-                    try:
-                        # Convert to datetime
-                        if 'T' in value:
-                            date_obj = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                        else:
-                            date_obj = datetime.fromisoformat(f"{value}T00:00:00")
-
-                        updates[full_key] = date_obj
-                    except Exception as e:
-                        print(f"Date conversion error for {full_key}: {e}")
-                        updates[full_key] = value
-                elif field_type == 'number' and isinstance(value, str):
-                    try:
-                        # Convert string to number
-                        if '.' in value:
-                            updates[full_key] = float(value)
-                        else:
-                            updates[full_key] = int(value)
-                    except ValueError:
-                        updates[full_key] = value
-                elif field_type == 'boolean' and isinstance(value, str):
-                    # Convert string to boolean
-                    updates[full_key] = value.lower() in ('true', 'yes', '1', 't', 'y')
-                elif field_type == 'array' and isinstance(value, str):
-                    try:
-                        # Try to parse JSON array
-                        updates[full_key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        # If not valid JSON, use as single value
-                        updates[full_key] = [value]
-                else:
-                    # Standard field
-                    updates[full_key] = value
+                updates[full_key] = value
+
+    def _coerce_date(self, full_key: str, value: str) -> Any:
+        """Convert a 'date' field value to a datetime, keeping it as-is if invalid.
+
+        The ISO 8601 fast path is tried first, then the known _DATE_FORMATS with
+        datetime.strptime. The last format that matched is tried first next time,
+        since rows in one request almost always share a format.
+
+        Args:
+            full_key: Dot notation name of the field, used in the error message
+            value: Date string submitted by Editor
+
+        Returns:
+            Parsed datetime object, or the original value if no format matches
+        """
+        try:
+            return _parse_iso_datetime(value)
+        except ValueError:
+            pass
+
+        preferred_format = self._preferred_date_format
+        if preferred_format is not None:
+            try:
+                return datetime.strptime(value, preferred_format)
+            except ValueError:
+                pass
+
+        for date_format in _DATE_FORMATS:
+            if date_format == preferred_format:
+                continue
+            try:
+                date_obj = datetime.strptime(value, date_format)
+            except ValueError:
+                continue
+            self._preferred_date_format = date_format
+            return date_obj
+
+        print(f"Date conversion error for {full_key}: unrecognized date format {value!r}")
+        return value
+
+    @staticmethod
+    def _coerce_number(value: str) -> Any:
+        """Convert a 'number' field value to int or float, keeping it as-is if not numeric."""
+        number = value.strip()
+        try:
+            if _INTEGER_PATTERN.fullmatch(number):
+                return int(number)
+            if _DECIMAL_PATTERN.fullmatch(number):
+                return float(number)
+        except ValueError:
+            # e.g. integers longer than the interpreter's int() digit limit
+            pass
+        return value
+
+    @staticmethod
+    def _coerce_boolean(value: str) -> bool:
+        """Convert a 'boolean' field value to a bool."""
+        return value.lower() in _TRUE_STRINGS
+
+    @staticmethod
+    def _coerce_array(value: str) -> List[Any]:
+        """Parse a JSON array for an 'array' field, wrapping invalid JSON as a single value."""
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return [value]
 
     def process(self) -> Dict[str, Any]:
         """Process the Editor request based on the action.
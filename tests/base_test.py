@@ -7,6 +7,20 @@ from pymongo.database import Database
 from mongo_datatables import DataTables
 
 
+class FakeCollection:
+    """Lightweight stand-in for a PyMongo Collection in Editor tests.
+
+    Exposes only the collection methods Editor calls, avoiding the attribute
+    introspection MagicMock(spec=Collection) performs for every test.
+    """
+
+    def __init__(self):
+        self.insert_many = MagicMock()
+        self.bulk_write = MagicMock()
+        self.find = MagicMock()
+        self.delete_one = MagicMock()
+
+
 class BaseDataTablesTest(unittest.TestCase):
     """Base test class for DataTables tests"""
 
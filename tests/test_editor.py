@@ -1,13 +1,15 @@
 import unittest
+import weakref
 from unittest.mock import MagicMock, patch
 import json
 from datetime import datetime
 from bson.objectid import ObjectId
-from pymongo.collection import Collection
-from pymongo.database import Database
-from pymongo.results import InsertOneResult, UpdateResult, DeleteResult
+from pymongo import UpdateOne
+from pymongo.results import InsertManyResult, BulkWriteResult, DeleteResult
 
 from mongo_datatables import Editor
+from mongo_datatables.datatables import DataField
+from tests.base_test import FakeCollection
 
 
 class TestEditor(unittest.TestCase):
@@ -17,8 +19,8 @@ class TestEditor(unittest.TestCase):
         """Set up test fixtures before each test method"""
         # Create a mock PyMongo object
         self.mongo = MagicMock()
-        self.mongo.db = MagicMock(spec=Database)
-        self.collection = MagicMock(spec=Collection)
+        self.mongo.db = MagicMock()
+        self.collection = FakeCollection()
         self.mongo.db.__getitem__.return_value = self.collection
 
         # Sample document IDs
@@ -258,33 +260,32 @@ class TestEditor(unittest.TestCase):
         """Test create method with data"""
         editor = Editor(self.mongo, 'users', self.create_args)
 
-        # Mock insert_one to return a successful result
-        insert_result = MagicMock(spec=InsertOneResult)
-        insert_result.inserted_id = ObjectId(self.sample_id)
-        self.collection.insert_one.return_value = insert_result
-
-        # Mock find_one to return the inserted document
-        self.collection.find_one.return_value = self.sample_doc
+        # Mock insert_many to return a successful result
+        insert_result = MagicMock(spec=InsertManyResult)
+        insert_result.inserted_ids = [ObjectId(self.sample_id)]
+        self.collection.insert_many.return_value = insert_result
 
         result = editor.create()
 
-        # Check insert_one was called with processed data
-        self.collection.insert_one.assert_called_once()
+        # Check insert_many was called with processed data
+        self.collection.insert_many.assert_called_once()
 
-        # Check find_one was called to get the inserted document
-        self.collection.find_one.assert_called_once_with({"_id": ObjectId(self.sample_id)})
+        # Check the inserted document is echoed back without re-reading it
+        self.collection.find.assert_not_called()
 
         # Check result contains the formatted document
         self.assertIn("data", result)
         self.assertEqual(len(result["data"]), 1)
         self.assertEqual(result["data"][0]["DT_RowId"], self.sample_id)
+        self.assertEqual(result["data"][0]["name"], "John Doe")
+        self.assertEqual(result["data"][0]["created_at"], "2023-01-01T12:00:00")
 
     def test_create_method_exception(self):
         """Test create method handling exceptions"""
         editor = Editor(self.mongo, 'users', self.create_args)
 
-        # Make insert_one raise an exception
-        self.collection.insert_one.side_effect = Exception("Database error")
+        # Make insert_many raise an exception
+        self.collection.insert_many.side_effect = Exception("Database error")
 
         result = editor.create()
 
@@ -303,24 +304,26 @@ class TestEditor(unittest.TestCase):
         """Test edit method with an ID"""
         editor = Editor(self.mongo, 'users', self.edit_args, self.sample_id)
 
-        # Mock update_one to return a successful result
-        update_result = MagicMock(spec=UpdateResult)
-        update_result.modified_count = 1
-        self.collection.update_one.return_value = update_result
+        # Mock bulk_write to return a successful result
+        bulk_result = MagicMock(spec=BulkWriteResult)
+        bulk_result.modified_count = 1
+        self.collection.bulk_write.return_value = bulk_result
 
-        # Mock find_one to return the updated document
-        self.collection.find_one.return_value = self.updated_doc
+        # Mock find to return the updated document
+        self.collection.find.return_value = [self.updated_doc]
 
         result = editor.edit()
 
-        # Check update_one was called with correct ID and data
-        self.collection.update_one.assert_called_once()
-        args, kwargs = self.collection.update_one.call_args
-        self.assertEqual(args[0], {"_id": ObjectId(self.sample_id)})
-        self.assertIn("$set", args[1])
+        # Check bulk_write was called with a single update for the correct ID and data
+        self.collection.bulk_write.assert_called_once()
+        args, kwargs = self.collection.bulk_write.call_args
+        self.assertEqual(args[0], [
+            UpdateOne({"_id": ObjectId(self.sample_id)}, {"$set": {"name": "Jane Smith", "status": "inactive"}})
+        ])
+        self.assertFalse(kwargs["ordered"])
 
-        # Check find_one was called to get the updated document
-        self.collection.find_one.assert_called_once_with({"_id": ObjectId(self.sample_id)})
+        # Check find was called to get the updated document
+        self.collection.find.assert_called_once_with({"_id": {"$in": [ObjectId(self.sample_id)]}})
 
         # Check result contains the formatted document
         self.assertIn("data", result)
@@ -345,8 +348,9 @@ class TestEditor(unittest.TestCase):
 
         result = editor.edit()
 
-        # Check update_one was not called
-        self.collection.update_one.assert_not_called()
+        # Check no database operations were issued
+        self.collection.bulk_write.assert_not_called()
+        self.collection.find.assert_not_called()
 
         # Check empty data is returned
         self.assertEqual(result["data"], [])
@@ -355,8 +359,8 @@ class TestEditor(unittest.TestCase):
         """Test edit method handling exceptions"""
         editor = Editor(self.mongo, 'users', self.edit_args, self.sample_id)
 
-        # Make update_one raise an exception
-        self.collection.update_one.side_effect = Exception("Database error")
+        # Make bulk_write raise an exception
+        self.collection.bulk_write.side_effect = Exception("Database error")
 
         result = editor.edit()
 
@@ -364,6 +368,16 @@ class TestEditor(unittest.TestCase):
         self.assertIn("error", result)
         self.assertEqual(result["error"], "Database error")
 
+    def test_editor_is_freed_without_garbage_collection(self):
+        """Test that an Editor with typed data fields holds no reference cycle"""
+        data_fields = [DataField("age", "number"), DataField("joined", "date")]
+        editor = Editor(self.mongo, 'users', self.edit_args, data_fields=data_fields)
+        editor_ref = weakref.ref(editor)
+
+        del editor
+
+        self.assertIsNone(editor_ref())
+
     def test_process_method_create(self):
         """Test process method for create action"""
         editor = Editor(self.mongo, 'users', self.create_args)
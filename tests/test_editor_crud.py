@@ -1,13 +1,13 @@
 import unittest
 from unittest.mock import MagicMock, patch
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from bson.objectid import ObjectId
-from pymongo.collection import Collection
-from pymongo.database import Database
-from pymongo.results import InsertOneResult, UpdateResult, DeleteResult
+from pymongo import UpdateOne
+from pymongo.results import InsertManyResult, BulkWriteResult, DeleteResult
 
 from mongo_datatables import Editor
+from tests.base_test import FakeCollection
 
 
 class TestEditorCRUD(unittest.TestCase):
@@ -17,8 +17,8 @@ class TestEditorCRUD(unittest.TestCase):
         """Set up test fixtures before each test method"""
         # Create a mock PyMongo object
         self.mongo = MagicMock()
-        self.mongo.db = MagicMock(spec=Database)
-        self.collection = MagicMock(spec=Collection)
+        self.mongo.db = MagicMock()
+        self.collection = FakeCollection()
         self.mongo.db.__getitem__.return_value = self.collection
 
         # Sample document IDs
@@ -27,19 +27,10 @@ class TestEditorCRUD(unittest.TestCase):
 
     def test_create_simple_document(self):
         """Test creating a simple document"""
-        # Mock insert_one to return success
-        insert_result = MagicMock(spec=InsertOneResult)
-        insert_result.inserted_id = ObjectId()
-        self.collection.insert_one.return_value = insert_result
-        
-        # Mock find_one to return our newly created document
-        created_doc = {
-            "_id": insert_result.inserted_id,
-            "name": "Test User",
-            "email": "test@example.com",
-            "age": 30
-        }
-        self.collection.find_one.return_value = created_doc
+        # Mock insert_many to return success
+        insert_result = MagicMock(spec=InsertManyResult)
+        insert_result.inserted_ids = [ObjectId()]
+        self.collection.insert_many.return_value = insert_result
         
         # Create Editor instance with create action
         request_args = {
@@ -58,7 +49,7 @@ class TestEditorCRUD(unittest.TestCase):
         result = editor.create()
         
         # Verify the insert operation was called
-        self.collection.insert_one.assert_called_once()
+        self.collection.insert_many.assert_called_once()
         
         # Verify the result contains the created document
         self.assertIn("data", result)
@@ -67,6 +58,63 @@ class TestEditorCRUD(unittest.TestCase):
         self.assertEqual(result["data"][0]["email"], "test@example.com")
         self.assertEqual(result["data"][0]["age"], 30)
 
+    def test_create_multiple_documents(self):
+        """Test creating several rows in a single insert"""
+        # Mock insert_many to return success
+        inserted_ids = [ObjectId(), ObjectId()]
+        insert_result = MagicMock(spec=InsertManyResult)
+        insert_result.inserted_ids = inserted_ids
+        self.collection.insert_many.return_value = insert_result
+        
+        # Create Editor instance with two rows
+        request_args = {
+            "action": "create",
+            "data": {
+                "0": {"name": "User 1"},
+                "1": {"name": "User 2"}
+            }
+        }
+        editor = Editor(self.mongo, 'users', request_args)
+        
+        # Perform the create
+        result = editor.create()
+        
+        # Verify both rows were inserted with one call
+        self.collection.insert_many.assert_called_once()
+        args, kwargs = self.collection.insert_many.call_args
+        self.assertEqual(args[0], [{"name": "User 1"}, {"name": "User 2"}])
+        
+        # Verify the result contains both documents in submission order
+        self.assertEqual([row["name"] for row in result["data"]], ["User 1", "User 2"])
+        self.assertEqual(result["data"][0]["DT_RowId"], str(inserted_ids[0]))
+
+    def test_create_echoes_dates_as_stored(self):
+        """Test that echoed dates match what MongoDB stores (naive UTC, milliseconds)"""
+        insert_result = MagicMock(spec=InsertManyResult)
+        insert_result.inserted_ids = [ObjectId()]
+        self.collection.insert_many.return_value = insert_result
+        
+        request_args = {
+            "action": "create",
+            "data": {
+                "0": {
+                    "created_at": "2023-03-10T09:15:30.123456+05:30",
+                    "meta.updated_at": "2023-03-10T09:15:30Z"
+                }
+            }
+        }
+        editor = Editor(self.mongo, 'users', request_args)
+        
+        result = editor.create()
+        
+        # The response uses the stored representation
+        self.assertEqual(result["data"][0]["created_at"], "2023-03-10T03:45:30.123000")
+        self.assertEqual(result["data"][0]["meta"]["updated_at"], datetime(2023, 3, 10, 9, 15, 30))
+        
+        # The document sent to the database is left untouched
+        args, kwargs = self.collection.insert_many.call_args
+        self.assertEqual(args[0][0]["created_at"].utcoffset(), timedelta(hours=5, minutes=30))
+
     def test_edit_simple_document(self):
         """Test editing a simple document"""
         # Create sample document in the database
@@ -78,13 +126,13 @@ class TestEditorCRUD(unittest.TestCase):
             "age": 25
         }
         
-        # Mock find_one to return our sample document
-        self.collection.find_one.return_value = original_doc
+        # Mock find to return our sample document
+        self.collection.find.return_value = [original_doc]
         
-        # Mock update_one to return success
-        update_result = MagicMock(spec=UpdateResult)
-        update_result.modified_count = 1
-        self.collection.update_one.return_value = update_result
+        # Mock bulk_write to return success
+        bulk_result = MagicMock(spec=BulkWriteResult)
+        bulk_result.modified_count = 1
+        self.collection.bulk_write.return_value = bulk_result
         
         # Create Editor instance with edit action
         request_args = {
@@ -105,22 +153,18 @@ class TestEditorCRUD(unittest.TestCase):
         result = editor.edit()
         
         # Verify the update operation was called with correct parameters
-        self.collection.update_one.assert_called_once()
+        self.collection.bulk_write.assert_called_once()
         
-        # Get the call arguments
-        args, kwargs = self.collection.update_one.call_args
-        filter_condition, update_operation = args
-        
-        # Verify filter condition uses the correct ID
-        self.assertEqual(filter_condition["_id"], ObjectId(doc_id))
-        
-        # Verify $set operation contains all the expected updates
-        self.assertIn("$set", update_operation)
-        set_updates = update_operation["$set"]
-        
-        self.assertEqual(set_updates["name"], "Updated Name")
-        self.assertEqual(set_updates["email"], "updated@example.com")
-        self.assertEqual(set_updates["age"], "35")
+        # Verify the single update targets the correct ID with all the expected updates
+        args, kwargs = self.collection.bulk_write.call_args
+        self.assertEqual(args[0], [
+            UpdateOne({"_id": ObjectId(doc_id)}, {"$set": {
+                "DT_RowId": doc_id,
+                "name": "Updated Name",
+                "email": "updated@example.com",
+                "age": "35"
+            }})
+        ])
 
     def test_remove_document(self):
         """Test removing a document"""
@@ -166,23 +210,15 @@ class TestEditorCRUD(unittest.TestCase):
         doc_id1 = self.sample_id
         doc_id2 = self.sample_id2
         
-        # Mock find_one to return our sample documents
-        doc1 = {"_id": ObjectId(doc_id1), "name": "User 1", "status": "active"}
-        doc2 = {"_id": ObjectId(doc_id2), "name": "User 2", "status": "inactive"}
-        
-        def mock_find_one(filter_dict):
-            if filter_dict["_id"] == ObjectId(doc_id1):
-                return doc1
-            elif filter_dict["_id"] == ObjectId(doc_id2):
-                return doc2
-            return None
+        # Mock find to return our sample documents (in a different order than requested)
+        doc1 = {"_id": ObjectId(doc_id1), "name": "User 1", "status": "approved"}
+        doc2 = {"_id": ObjectId(doc_id2), "name": "User 2", "status": "approved"}
+        self.collection.find.return_value = [doc2, doc1]
         
-        self.collection.find_one.side_effect = mock_find_one
-        
-        # Mock update_one to return success
-        update_result = MagicMock(spec=UpdateResult)
-        update_result.modified_count = 1
-        self.collection.update_one.return_value = update_result
+        # Mock bulk_write to return success
+        bulk_result = MagicMock(spec=BulkWriteResult)
+        bulk_result.modified_count = 2
+        self.collection.bulk_write.return_value = bulk_result
         
         # Create Editor instance with edit action for multiple documents
         request_args = {
@@ -203,12 +239,19 @@ class TestEditorCRUD(unittest.TestCase):
         # Perform the batch edit
         result = editor.edit()
         
-        # Verify the update operation was called twice
-        self.assertEqual(self.collection.update_one.call_count, 2)
+        # Verify both updates were sent in a single bulk write
+        self.collection.bulk_write.assert_called_once()
+        args, kwargs = self.collection.bulk_write.call_args
+        self.assertEqual(len(args[0]), 2)
+        
+        # Verify both documents were read back in a single query
+        self.collection.find.assert_called_once_with({"_id": {"$in": [ObjectId(doc_id1), ObjectId(doc_id2)]}})
         
-        # Verify the result contains both updated documents
+        # Verify the result contains both updated documents in the requested order
         self.assertIn("data", result)
         self.assertEqual(len(result["data"]), 2)
+        self.assertEqual(result["data"][0]["DT_RowId"], doc_id1)
+        self.assertEqual(result["data"][1]["DT_RowId"], doc_id2)
 
 
 if __name__ == '__main__':
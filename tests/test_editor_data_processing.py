@@ -1,12 +1,12 @@
+import sys
 import unittest
 from unittest.mock import MagicMock, patch
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from bson.objectid import ObjectId
-from pymongo.collection import Collection
-from pymongo.database import Database
 
 from mongo_datatables import Editor
+from tests.base_test import FakeCollection
 from mongo_datatables.datatables import DataField
 
 
@@ -17,11 +17,11 @@ class TestEditorDataProcessing(unittest.TestCase):
         """Set up test fixtures before each test method"""
         # Create a mock PyMongo object
         self.mongo = MagicMock()
-        self.mongo.db = MagicMock(spec=Database)
-        self.collection = MagicMock(spec=Collection)
+        self.mongo.db = MagicMock()
+        self.collection = FakeCollection()
         self.mongo.db.__getitem__.return_value = self.collection
 
-    def test_process_updates_with_type_conversions(self):
+    def test_process_batch_with_type_conversions(self):
         """Test processing updates with various type conversions"""
         # Create Editor instance with data_fields
         data_fields = [
@@ -41,8 +41,7 @@ class TestEditorDataProcessing(unittest.TestCase):
         }
         
         # Process updates
-        updates = {}
-        editor._process_updates(data, updates)
+        updates = editor._process_batch({"row": data})["row"]
         
         # Verify type conversions
         self.assertEqual(updates["age"], 30)  # String to int
@@ -50,7 +49,7 @@ class TestEditorDataProcessing(unittest.TestCase):
         self.assertEqual(updates["scores"], [90, 85, 95])  # JSON string to array
         self.assertIsInstance(updates["birthday"], datetime)  # String to datetime
 
-    def test_process_updates_with_invalid_values(self):
+    def test_process_batch_with_invalid_values(self):
         """Test processing updates with invalid values that should be handled gracefully"""
         # Create Editor instance with data_fields
         data_fields = [
@@ -68,14 +67,112 @@ class TestEditorDataProcessing(unittest.TestCase):
         }
         
         # Process updates
-        updates = {}
-        editor._process_updates(data, updates)
+        updates = editor._process_batch({"row": data})["row"]
         
         # Verify invalid values are handled gracefully
         self.assertEqual(updates["age"], "not-a-number")  # Kept as string
         self.assertEqual(updates["joined_date"], "invalid-date")  # Kept as string
         self.assertEqual(updates["tags"], ["not-valid-json"])  # Treated as single-item array
 
+    def test_process_batch_reports_field_of_invalid_date(self):
+        """Test that a failed date conversion names the field"""
+        data_fields = [DataField("profile.joined_date", "date")]
+        editor = Editor(self.mongo, 'users', {}, data_fields=data_fields)
+
+        with patch('builtins.print') as mock_print:
+            updates = editor._process_batch({"row": {"profile": {"joined_date": "invalid-date"}}})["row"]
+
+        self.assertEqual(updates["profile.joined_date"], "invalid-date")
+        mock_print.assert_called_once()
+        self.assertIn("profile.joined_date", mock_print.call_args[0][0])
+
+    def test_process_batch_with_number_formats(self):
+        """Test number conversion for signed, padded, decimal and non-numeric values"""
+        data_fields = [DataField(name, "number") for name in ("a", "b", "c", "d", "e", "f")]
+        editor = Editor(self.mongo, 'users', {}, data_fields=data_fields)
+
+        updates = editor._process_batch({"row": {"a": " -42 ", "b": "+7", "c": "3.25", "d": ".5", "e": "1.5e3", "f": "12abc"}})["row"]
+
+        self.assertEqual(updates["a"], -42)
+        self.assertEqual(updates["b"], 7)
+        self.assertEqual(updates["c"], 3.25)
+        self.assertEqual(updates["d"], 0.5)
+        self.assertEqual(updates["e"], 1500.0)
+        self.assertEqual(updates["f"], "12abc")  # Kept as string
+
+    def test_process_batch_with_number_edge_cases(self):
+        """Test underscore-separated numbers and integers too long for int()"""
+        data_fields = [DataField(name, "number") for name in ("a", "b", "c", "d")]
+        editor = Editor(self.mongo, 'users', {}, data_fields=data_fields)
+
+        too_long = "9" * 5000
+        max_digits = getattr(sys, "get_int_max_str_digits", lambda: 0)()
+        updates = editor._process_batch({"row": {"a": "1_000", "b": "1_000.5", "c": "1__000", "d": too_long}})["row"]
+
+        self.assertEqual(updates["a"], 1000)
+        self.assertEqual(updates["b"], 1000.5)
+        self.assertEqual(updates["c"], "1__000")  # Kept as string
+        if max_digits and len(too_long) > max_digits:
+            self.assertEqual(updates["d"], too_long)  # Kept as string
+        else:
+            self.assertEqual(updates["d"], int(too_long))
+
+    def test_process_batch_with_utc_date(self):
+        """Test that a trailing 'Z' on a date field is parsed as UTC"""
+        data_fields = [DataField("joined_date", "date")]
+        editor = Editor(self.mongo, 'users', {}, data_fields=data_fields)
+
+        updates = editor._process_batch({"row": {"joined_date": "2023-03-10T09:15:30Z"}})["row"]
+
+        self.assertEqual(updates["joined_date"], datetime(2023, 3, 10, 9, 15, 30, tzinfo=timezone.utc))
+
+    def test_process_batch_with_non_iso_date(self):
+        """Test that declared date fields accept the known non-ISO formats"""
+        data_fields = [DataField("joined_date", "date"), DataField("last_seen", "date")]
+        editor = Editor(self.mongo, 'users', {}, data_fields=data_fields)
+
+        updates = editor._process_batch({"row": {"joined_date": "2023/05/15", "last_seen": "2023-05-15T10:30:00.1"}})["row"]
+
+        self.assertEqual(updates["joined_date"], datetime(2023, 5, 15))
+        self.assertEqual(updates["last_seen"], datetime(2023, 5, 15, 10, 30, 0, 100000))
+
+    def test_process_batch_remembers_matching_date_format(self):
+        """Test that the last matching non-ISO date format is tried first"""
+        data_fields = [DataField("joined_date", "date")]
+        editor = Editor(self.mongo, 'users', {}, data_fields=data_fields)
+
+        updates = editor._process_batch({"row": {"joined_date": "2023/05/15"}})["row"]
+        self.assertEqual(editor._preferred_date_format, "%Y/%m/%d")
+
+        # A different format is still recognized and becomes the preferred one
+        updates = editor._process_batch({"row": {"joined_date": "2023/05/16 08:00:00"}})["row"]
+        self.assertEqual(updates["joined_date"], datetime(2023, 5, 16, 8, 0, 0))
+        self.assertEqual(editor._preferred_date_format, "%Y/%m/%d %H:%M:%S")
+
+    def test_process_batch_converts_each_column(self):
+        """Test batch processing converts typed columns across rows and keeps rows separate"""
+        data_fields = [
+            DataField("age", "number"),
+            DataField("profile.joined_date", "date")
+        ]
+        editor = Editor(self.mongo, 'users', {}, data_fields=data_fields)
+
+        rows = {
+            "row1": {"age": "30", "name": "Alice", "profile": {"joined_date": "2023-05-15"}},
+            "row2": {"age": "n/a", "name": None, "profile": {"joined_date": "2023-06-01T08:00:00"}},
+        }
+        updates_by_row = editor._process_batch(rows)
+
+        self.assertEqual(updates_by_row["row1"], {
+            "age": 30,
+            "name": "Alice",
+            "profile.joined_date": datetime(2023, 5, 15)
+        })
+        self.assertEqual(updates_by_row["row2"], {
+            "age": "n/a",  # Kept as string
+            "profile.joined_date": datetime(2023, 6, 1, 8, 0, 0)
+        })
+
     def test_preprocess_document_with_date_fields(self):
         """Test preprocessing document with date fields"""
         # Create Editor instance with create action
@@ -116,6 +213,20 @@ class TestEditorDataProcessing(unittest.TestCase):
         self.assertEqual(dot_notation["metadata.last_login_time"].month, 3)
         self.assertEqual(dot_notation["metadata.last_login_time"].day, 10)
 
+    def test_preprocess_document_with_non_date_values_in_date_named_fields(self):
+        """Test that text values of fields named like dates are kept as strings"""
+        editor = Editor(self.mongo, 'users', {})
+
+        processed_doc, dot_notation = editor._preprocess_document({
+            "format": "PDF document",
+            "start_time": "soon",
+            "meta.updated_at": "2023-13-45",
+        })
+
+        self.assertEqual(processed_doc["format"], "PDF document")
+        self.assertEqual(processed_doc["start_time"], "soon")
+        self.assertEqual(dot_notation["meta.updated_at"], "2023-13-45")
+
     def test_preprocess_document_with_json_data(self):
         """Test preprocessing document with JSON string data"""
         # Create Editor instance with create action
@@ -141,6 +252,19 @@ class TestEditorDataProcessing(unittest.TestCase):
         self.assertEqual(processed_doc["tags"], ["tag1", "tag2"])
         self.assertEqual(processed_doc["metadata"], {"key": "value"})
 
+    def test_preprocess_document_keeps_exact_json_values(self):
+        """Test that JSON values outside the 64-bit range and NaN are parsed like the stdlib"""
+        editor = Editor(self.mongo, 'users', {})
+
+        processed_doc, dot_notation = editor._preprocess_document({
+            "big": "[12345678901234567890123]",
+            "ratio": "NaN",
+        })
+
+        self.assertEqual(processed_doc["big"], [12345678901234567890123])
+        self.assertIsInstance(processed_doc["ratio"], float)
+        self.assertNotEqual(processed_doc["ratio"], processed_doc["ratio"])  # NaN
+
     def test_format_response_document(self):
         """Test formatting document for response"""
         # Create Editor instance
@@ -4,11 +4,11 @@ import json
 from datetime import datetime
 from bson.objectid import ObjectId
 from mongo_datatables.datatables import DataField
-from pymongo.collection import Collection
-from pymongo.database import Database
-from pymongo.results import InsertOneResult, UpdateResult
+from pymongo import UpdateOne
+from pymongo.results import InsertManyResult, BulkWriteResult
 
 from mongo_datatables import Editor
+from tests.base_test import FakeCollection
 
 
 class TestEditorNestedData(unittest.TestCase):
@@ -18,8 +18,8 @@ class TestEditorNestedData(unittest.TestCase):
         """Set up test fixtures before each test method"""
         # Create a mock PyMongo object
         self.mongo = MagicMock()
-        self.mongo.db = MagicMock(spec=Database)
-        self.collection = MagicMock(spec=Collection)
+        self.mongo.db = MagicMock()
+        self.collection = FakeCollection()
         self.mongo.db.__getitem__.return_value = self.collection
 
         # Sample document IDs
@@ -60,7 +60,7 @@ class TestEditorNestedData(unittest.TestCase):
         self.assertNotIn("contact.email", processed_doc)
         self.assertNotIn("contact.phone", processed_doc)
 
-    def test_process_updates_with_nested_data(self):
+    def test_process_batch_with_nested_data(self):
         """Test processing updates with nested data structures"""
         # Create Editor instance with data_fields
         data_fields = [
@@ -89,8 +89,7 @@ class TestEditorNestedData(unittest.TestCase):
         }
         
         # Process updates
-        updates = {}
-        editor._process_updates(data, updates)
+        updates = editor._process_batch({"row": data})["row"]
         
         # Verify updates were processed correctly
         self.assertIsInstance(updates["profile.joined_date"], datetime)
@@ -120,13 +119,13 @@ class TestEditorNestedData(unittest.TestCase):
             }
         }
         
-        # Mock find_one to return our sample document
-        self.collection.find_one.return_value = original_doc
+        # Mock find to return our sample document
+        self.collection.find.return_value = [original_doc]
         
-        # Mock update_one to return success
-        update_result = MagicMock(spec=UpdateResult)
-        update_result.modified_count = 1
-        self.collection.update_one.return_value = update_result
+        # Mock bulk_write to return success
+        bulk_result = MagicMock(spec=BulkWriteResult)
+        bulk_result.modified_count = 1
+        self.collection.bulk_write.return_value = bulk_result
         
         # Create Editor instance with edit action and nested updates
         request_args = {
@@ -152,24 +151,20 @@ class TestEditorNestedData(unittest.TestCase):
         result = editor.edit()
         
         # Verify the update operation was called with correct parameters
-        self.collection.update_one.assert_called_once()
-        
-        # Get the call arguments
-        args, kwargs = self.collection.update_one.call_args
-        filter_condition, update_operation = args
-        
-        # Verify filter condition uses the correct ID
-        self.assertEqual(filter_condition["_id"], ObjectId(doc_id))
-        
-        # Verify $set operation contains all the expected updates
-        self.assertIn("$set", update_operation)
-        set_updates = update_operation["$set"]
-        
-        self.assertEqual(set_updates["name"], "Updated Name")
-        self.assertEqual(set_updates["profile.bio"], "Updated Bio")
-        self.assertEqual(set_updates["profile.skills"], ["Python", "MongoDB"])
-        self.assertEqual(set_updates["contact.email"], "updated@example.com")
-        self.assertEqual(set_updates["contact.phone"], "987-654-3210")
+        self.collection.bulk_write.assert_called_once()
+        
+        # Verify the single update targets the correct ID with all the expected updates
+        args, kwargs = self.collection.bulk_write.call_args
+        self.assertEqual(args[0], [
+            UpdateOne({"_id": ObjectId(doc_id)}, {"$set": {
+                "DT_RowId": doc_id,
+                "name": "Updated Name",
+                "profile.bio": "Updated Bio",
+                "profile.skills": ["Python", "MongoDB"],
+                "contact.email": "updated@example.com",
+                "contact.phone": "987-654-3210"
+            }})
+        ])
         
         # Verify the result contains the updated document
         self.assertIn("data", result)
@@ -177,26 +172,10 @@ class TestEditorNestedData(unittest.TestCase):
 
     def test_create_with_complex_nested_structure(self):
         """Test create operation with complex nested structure"""
-        # Mock insert_one to return success
-        insert_result = MagicMock(spec=InsertOneResult)
-        insert_result.inserted_id = ObjectId()
-        self.collection.insert_one.return_value = insert_result
-        
-        # Mock find_one to return our newly created document
-        created_doc = {
-            "_id": insert_result.inserted_id,
-            "name": "New User",
-            "profile": {
-                "bio": "Developer",
-                "skills": ["Python", "MongoDB"]
-            },
-            "contact": {
-                "email": "new@example.com",
-                "phone": "123-456-7890"
-            },
-            "created_at": datetime(2023, 6, 15, 10, 30, 0)
-        }
-        self.collection.find_one.return_value = created_doc
+        # Mock insert_many to return success
+        insert_result = MagicMock(spec=InsertManyResult)
+        insert_result.inserted_ids = [ObjectId()]
+        self.collection.insert_many.return_value = insert_result
         
         # Create Editor instance with create action and nested structure
         request_args = {
@@ -217,12 +196,13 @@ class TestEditorNestedData(unittest.TestCase):
         # Perform the create
         result = editor.create()
         
-        # Verify the insert operation was called
-        self.collection.insert_one.assert_called_once()
+        # Verify the insert operation was called with a single document
+        self.collection.insert_many.assert_called_once()
         
         # Get the call arguments
-        args, kwargs = self.collection.insert_one.call_args
-        inserted_doc = args[0]
+        args, kwargs = self.collection.insert_many.call_args
+        self.assertEqual(len(args[0]), 1)
+        inserted_doc = args[0][0]
         
         # Verify the document structure is correct
         self.assertEqual(inserted_doc["name"], "New User")